@@ -6,21 +6,51 @@ import shutil
 import datetime
 import subprocess
 import sys
+import ctypes
+import hashlib
+import json
+import queue
+from contextlib import contextmanager
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+import importlib.util
 
 # --- New Dependency Check ---
 # Features require the Pillow library (PIL).
-try:
-    from PIL import ImageGrab, Image, ImageTk
-    PIL_AVAILABLE = True
-except ImportError:
-    PIL_AVAILABLE = False
-    Image = None
-    ImageTk = None
+# Only checked here; PIL itself is imported where images are used, so startup doesn't pay for it.
+PIL_AVAILABLE = importlib.util.find_spec('PIL') is not None
 
 # Define the directory and database file
 APP_DIR = os.path.join(os.path.expanduser('~'), 'BrainDumpApp')
 DB_FILE = os.path.join(APP_DIR, 'braindump.db')
 FILES_DIR = os.path.join(APP_DIR, 'files')
+THUMBS_DIR = os.path.join(APP_DIR, 'thumbs') # Cached preview thumbnails
+
+# Number of entries fetched per page for the entries list
+PAGE_SIZE = 500
+# Height of one entries list row in pixels (used to work out how many rows are visible)
+TREE_ROW_HEIGHT = 25
+
+# Number of decoded image previews kept in memory
+THUMB_CACHE_SIZE = 32
+# Number of preview thumbnails kept on disk (oldest are removed at startup).
+# They are stored as raw RGBA/RGB pixels (~1 MB each), so keep this modest.
+THUMB_DISK_CACHE_SIZE = 100
+
+# File extensions treated as images
+IMAGE_EXTENSIONS = frozenset({'.png', '.jpg', '.jpeg', '.bmp', '.gif', '.webp'})
+
+# Windows clipboard image formats (see winuser.h)
+CF_BITMAP = 2
+CF_DIB = 8
+CF_DIBV5 = 17
+
+# Buffer size for copying files into storage (1 MB -> far fewer read/write calls than the 16-64 KB defaults)
+COPY_BUFFER_SIZE = 1 << 20
+
+# How often (ms) the Tk thread checks for finished background jobs while any are running
+COMPLETION_POLL_MS = 20
 
 # --- NEW: UI Color Palette (Dark Mode) ---
 BG_COLOR = '#2b2b2b'       # Dark gray background
@@ -33,6 +63,177 @@ ENTRY_BG = '#454545'      # Background for text entries
 SELECTED_BG = '#555555'     # Background for selected/active items
 CURSOR_COLOR = '#dcdcdc'    # Text cursor color
 
+def build_fts_query(search_term):
+    """Turns free-form search text into an FTS5 query where every word must match as a prefix."""
+    return ' '.join('"' + word.replace('"', '""') + '"*' for word in search_term.split())
+
+def copy_file_fast(src, dst):
+    """
+    Copies a file's data and metadata from src to dst.
+    Uses CopyFile2 on Windows and in-kernel copy_file_range on Linux,
+    falling back to a large-buffer readinto loop everywhere else.
+    """
+    if sys.platform == "win32":
+        copy_file2 = getattr(ctypes.windll.kernel32, 'CopyFile2', None) # Windows 8+
+        if copy_file2 and copy_file2(ctypes.c_wchar_p(src), ctypes.c_wchar_p(dst), None) == 0: # S_OK
+            return # CopyFile2 also copies timestamps and attributes
+
+    with open(src, 'rb', buffering=0) as fsrc, open(dst, 'wb', buffering=0) as fdst:
+        if hasattr(os, 'copy_file_range'):
+            try:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if not copied:
+                        break
+                    remaining -= copied
+            except OSError:
+                pass # Not supported here (e.g. cross-filesystem on older kernels); the loop below finishes the copy
+
+        buf = bytearray(COPY_BUFFER_SIZE)
+        view = memoryview(buf)
+        while True:
+            n = fsrc.readinto(buf)
+            if not n:
+                break
+            written = 0
+            while written < n:
+                written += fdst.write(view[written:n])
+
+    shutil.copystat(src, dst)
+
+def reserve_storage_path(filename):
+    """
+    Claims a free path in FILES_DIR for filename by creating it empty (atomically, mode 'xb'),
+    adding a timestamp, then a counter, on conflicts. Safe to call from several workers at once.
+    """
+    base, ext = os.path.splitext(filename)
+    timestamp = datetime.datetime.now().strftime("%Y%m%d%H%M%S")
+    path = os.path.join(FILES_DIR, filename)
+    attempt = 0
+    while True:
+        try:
+            open(path, 'xb').close()
+            return path
+        except FileExistsError:
+            attempt += 1
+            suffix = timestamp if attempt == 1 else f"{timestamp}_{attempt}"
+            path = os.path.join(FILES_DIR, f"{base}_{suffix}{ext}")
+
+def clipboard_may_have_image():
+    """
+    Cheap check before ImageGrab.grabclipboard(), which decodes the whole bitmap.
+    On Windows asks which formats the clipboard holds; elsewhere there is no
+    cheap check, so it always returns True.
+    """
+    if sys.platform != "win32":
+        return True
+    user32 = ctypes.windll.user32
+    image_formats = (CF_BITMAP, CF_DIB, CF_DIBV5, user32.RegisterClipboardFormatW("PNG"))
+    return any(user32.IsClipboardFormatAvailable(fmt) for fmt in image_formats)
+
+@lru_cache(maxsize=None)
+def get_resizer():
+    """
+    Returns (resizer, options) for SIMD (SSE4.1/AVX2) preview resizing, or None if the
+    optional cykooz.resizer package isn't installed. Imported on first use and created once,
+    so the CPU-specific kernels are picked a single time.
+    """
+    try:
+        from cykooz_resizer import Resizer, ResizeAlg, ResizeOptions, FilterType
+    except ImportError:
+        return None
+    return Resizer(), ResizeOptions(resize_alg=ResizeAlg.convolution(FilterType.lanczos3))
+
+def launch_detached(args):
+    """Starts an external program without waiting for it (or letting it hold our console/session)."""
+    subprocess.Popen(args, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, start_new_session=True)
+
+def trim_thumbnail_cache():
+    """Removes all but the THUMB_DISK_CACHE_SIZE most recently used thumbnails."""
+    try:
+        with os.scandir(THUMBS_DIR) as it:
+            files = [entry for entry in it if entry.is_file()]
+        # A thumbnail is a <digest>.bin/<digest>.meta.json pair; the .meta.json mtime tracks use
+        metas = sorted((entry for entry in files if entry.name.endswith('.meta.json')), key=lambda entry: entry.stat().st_mtime, reverse=True)
+        keep = {entry.name.split('.', 1)[0] for entry in metas[:THUMB_DISK_CACHE_SIZE]}
+        for entry in files:
+            if entry.name.split('.', 1)[0] not in keep: # Also clears orphans and old-format thumbnails
+                os.remove(entry.path)
+    except OSError:
+        pass # Trimming is best-effort
+
+def load_thumbnail(filepath, mtime, max_width):
+    """
+    Returns the image at filepath scaled down to max_width, using the on-disk
+    thumbnail cache so repeat views skip both the decode and the resize.
+    Runs on the image pool, so it must not touch Tk.
+    """
+    digest = hashlib.blake2b(f"{filepath}|{mtime}|{max_width}".encode()).hexdigest()[:16]
+    cache_base = os.path.join(THUMBS_DIR, digest)
+    img = read_raw_thumbnail(cache_base)
+    if img is not None:
+        return img
+    
+    from PIL import Image
+    img = Image.open(filepath)
+    img_width, img_height = img.size
+    
+    if img_width > max_width:
+        new_height = max(1, int(img_height * max_width / img_width))
+        # JPEGs: have libjpeg decode straight at 1/2, 1/4 or 1/8 scale (a no-op for other formats)
+        img.draft(None, (max_width, new_height))
+        if img.mode not in ('L', 'RGB', 'RGBA'):
+            # Palette, 1-bit, CMYK, 16-bit, LA etc. can't be reduced or SIMD-resized as they are.
+            # Grayscale stays grayscale, so its raw thumbnail isn't 3-4x bigger than needed.
+            if 'A' in img.getbands() or 'transparency' in img.info:
+                img = img.convert('RGBA')
+            else:
+                img = img.convert('L' if img.mode == '1' else 'RGB')
+        
+        resizer = get_resizer()
+        if resizer is not None:
+            # Very large images: cheap integer box reduction first, so the SIMD pass
+            # runs on a buffer close to the target size instead of the full original
+            if img.width > 4 * max_width:
+                img = img.reduce(img.width // max_width)
+            dst = Image.new(img.mode, (max_width, new_height))
+            resizer[0].resize_pil(img, dst, resizer[1])
+            img = dst
+        else:
+            # thumbnail keeps the aspect ratio and, via reducing_gap, box-reduces very large images first
+            img.thumbnail((max_width, img.height), Image.Resampling.LANCZOS, reducing_gap=3.0)
+        
+        # Only resized images are worth caching; small ones are quick to load as they are
+        write_raw_thumbnail(cache_base, img)
+    img.load()
+    return img
+
+def read_raw_thumbnail(cache_base):
+    """Loads a thumbnail saved by write_raw_thumbnail, or returns None if there isn't a usable one."""
+    from PIL import Image
+    try:
+        with open(cache_base + ".meta.json", encoding='utf-8') as f:
+            meta = json.load(f)
+        with open(cache_base + ".bin", 'rb') as f:
+            raw = f.read()
+        os.utime(cache_base + ".meta.json") # Mark as recently used for trim_thumbnail_cache
+        # Raw pixels: no PNG/JPEG decode, just a copy into the image buffer
+        return Image.frombytes(meta['mode'], tuple(meta['size']), raw)
+    except (OSError, ValueError, KeyError, TypeError):
+        return None # Missing, partly written or corrupt: decode the original instead
+
+def write_raw_thumbnail(cache_base, img):
+    """Saves img's raw pixels as <cache_base>.bin, plus a .meta.json with its mode and size."""
+    try:
+        with open(cache_base + ".bin", 'wb') as f:
+            f.write(img.tobytes())
+        # Written last, so a .meta.json always has a complete .bin next to it
+        with open(cache_base + ".meta.json", 'w', encoding='utf-8') as f:
+            json.dump({'mode': img.mode, 'size': img.size}, f)
+    except OSError:
+        pass # A missing thumbnail just means decoding again next time
+
 class BrainDumpApp:
     def __init__(self, root):
         self.root = root
@@ -43,83 +244,49 @@ class BrainDumpApp:
         
         # This will hold a reference to the displayed image to prevent garbage collection
         self.photo_image = None
+        # Recently shown image previews, keyed by (filepath, mtime, max_width); oldest first
+        self._thumb_cache = OrderedDict()
+        # --- Virtualized entries list ---
+        # All rows fetched so far as (entry_id, (date, type, preview)); only the visible window is in the Treeview
+        self._rows = []
+        self._has_more = False # Last page was full, so scrolling to the end fetches another
+        self._view_top = 0 # Index in self._rows of the first row shown
+        self._visible_rows = 0
+        self._selected_entry_id = None
+        # Display area views, built on first use and then reused (see build_entry_view)
+        self._welcome_frame = None
+        self._entry_frame = None
+        # Entry currently shown; read by the display buttons' callbacks
+        self._current_entry_id = None
+        self._current_filepath = None
+        # Maps Treeview item ids to database entry ids
+        self._iid_to_entry = {}
+        # Pending after() id for the debounced search-as-you-type reload
+        self._search_after_id = None
+        # Pending after() id for the debounced display of the selected entry
+        self._display_pending_id = None
+        # Worker threads for file copies and image encodes, so the UI doesn't freeze on big files.
+        # SQLite work stays on the Tk thread.
+        self.io_pool = ThreadPoolExecutor(max_workers=2)
+        # Finished jobs as (on_done, future). Workers only put here and never call into Tk,
+        # which would block them until the Tk thread is free (and deadlock shutdown).
+        self._completions = queue.Queue()
+        self._jobs_in_flight = 0
+        self._completion_poll_id = None
+        # Separate pool for preview decodes, so they never queue behind a large file copy
+        self.image_pool = ThreadPoolExecutor(max_workers=2)
+        self._pending_preview = None # Future of the preview decode the display is waiting for
+        self._canvas_width = 500 # Display canvas width, kept current by on_canvas_configure
 
         # Ensure database and directories exist
         self.setup_database()
+        self._list_queries = self.build_list_queries()
 
         # --- Configure Styles (Dark Mode) ---
+        # Only the theme is set here; the (slow) per-style configuration runs in _deferred_init
         self.style = ttk.Style()
         self.style.theme_use('clam') # 'clam' is a good base for customization
 
-        # General styles
-        self.style.configure('.',
-            font=('Helvetica', 10),
-            background=BG_COLOR,
-            foreground=TEXT_COLOR,
-            fieldbackground=ENTRY_BG,
-            bordercolor=BORDER_COLOR,
-            lightcolor=FRAME_COLOR,
-            darkcolor=BG_COLOR
-        )
-        self.style.configure('TFrame', background=BG_COLOR)
-        self.style.configure('TLabel', background=BG_COLOR, foreground=TEXT_COLOR)
-        self.style.configure('Header.TLabel', font=('Helvetica', 16, 'bold'), background=BG_COLOR)
-        self.style.configure('Meta.TLabel', font=('Helvetica', 9, 'italic'), foreground=LIGHT_TEXT, background=FRAME_COLOR)
-        self.style.configure('Bold.TLabel', font=('Helvetica', 10, 'bold'), background=FRAME_COLOR)
-
-        # Content Frame style
-        self.style.configure('Content.TFrame', background=FRAME_COLOR, relief=tk.SOLID, borderwidth=1, bordercolor=BORDER_COLOR)
-
-        # Button styles
-        self.style.configure('TButton', font=('Helvetica', 10, 'bold'), padding=8, relief=tk.FLAT, borderwidth=0)
-        self.style.map('TButton',
-            background=[('!active', ACCENT_COLOR), ('active', '#5aa0eb')],
-            foreground=[('!disabled', '#ffffff')])
-        
-        # Style for the "Paste" button
-        self.style.configure('Paste.TButton', font=('Helvetica', 10, 'bold'), padding=8, relief=tk.FLAT, borderwidth=0)
-        self.style.map('Paste.TButton',
-            background=[('!active', '#28a745'), ('active', '#34c759')], # Green
-            foreground=[('!disabled', '#ffffff')])
-
-        # Entry widget
-        self.style.configure('TEntry',
-            font=('Helvetica', 10),
-            padding=5,
-            relief=tk.FLAT,
-            borderwidth=1,
-            fieldbackground=ENTRY_BG,
-            foreground=TEXT_COLOR
-        )
-        self.style.map('TEntry',
-            bordercolor=[('focus', ACCENT_COLOR), ('!focus', BORDER_COLOR)],
-            fieldbackground=[('disabled', BG_COLOR)]
-        )
-        
-        # --- Treeview (List) Style ---
-        self.style.configure('Treeview',
-            background=FRAME_COLOR,
-            fieldbackground=FRAME_COLOR,
-            foreground=TEXT_COLOR,
-            rowheight=25,
-            relief=tk.FLAT,
-            borderwidth=0)
-        self.style.map('Treeview',
-            background=[('selected', ACCENT_COLOR)],
-            foreground=[('selected', '#ffffff')]
-        )
-        self.style.configure('Treeview.Heading',
-            font=('Helvetica', 10, 'bold'),
-            padding=5,
-            relief=tk.FLAT,
-            background=SELECTED_BG,
-            foreground=TEXT_COLOR
-        )
-        self.style.map('Treeview.Heading',
-            background=[('!active', SELECTED_BG), ('active', FRAME_COLOR)],
-            foreground=[('!active', TEXT_COLOR)]
-        )
-
         # --- Main Layout ---
         self.main_frame = ttk.Frame(root, padding=10)
         self.main_frame.pack(fill=tk.BOTH, expand=True)
@@ -177,8 +344,9 @@ class BrainDumpApp:
         ttk.Label(self.search_frame, text="Search Content:", background=FRAME_COLOR).pack(side=tk.LEFT, padx=(0, 5))
         self.search_entry = ttk.Entry(self.search_frame)
         self.search_entry.pack(side=tk.LEFT, fill=tk.X, expand=True)
-        self.search_entry.bind("<Return>", lambda e: self.load_entries())
-        self.search_entry.bind("<KeyRelease>", lambda e: self.load_entries())
+        self.search_entry.bind("<Return>", self.search_now)
+        self.search_entry.bind("<KP_Enter>", self.search_now)
+        self.search_entry.bind("<KeyRelease>", self.schedule_search)
         
         # --- NEW: Tag Filter ---
         self.tag_filter_frame = ttk.Frame(self.list_frame, style='Content.TFrame')
@@ -186,8 +354,9 @@ class BrainDumpApp:
         ttk.Label(self.tag_filter_frame, text="Filter by Tag:", background=FRAME_COLOR).pack(side=tk.LEFT, padx=(0, 5))
         self.tag_filter_entry = ttk.Entry(self.tag_filter_frame)
         self.tag_filter_entry.pack(side=tk.LEFT, fill=tk.X, expand=True)
-        self.tag_filter_entry.bind("<Return>", lambda e: self.load_entries())
-        self.tag_filter_entry.bind("<KeyRelease>", lambda e: self.load_entries())
+        self.tag_filter_entry.bind("<Return>", self.search_now)
+        self.tag_filter_entry.bind("<KP_Enter>", self.search_now)
+        self.tag_filter_entry.bind("<KeyRelease>", self.schedule_search)
 
 
         # --- Treeview ---
@@ -195,13 +364,14 @@ class BrainDumpApp:
         self.tree_frame.grid(row=3, column=0, columnspan=2, sticky='nsew') # Changed row
         self.tree_scroll_y = ttk.Scrollbar(self.tree_frame, orient=tk.VERTICAL)
         
+        # The scrollbar is driven by show_rows() rather than the tree itself,
+        # because the tree only ever holds the visible window of rows.
         self.tree = ttk.Treeview(
             self.tree_frame,
             columns=('date', 'type', 'preview'),
-            show='headings',
-            yscrollcommand=self.tree_scroll_y.set
+            show='headings'
         )
-        self.tree_scroll_y.config(command=self.tree.yview)
+        self.tree_scroll_y.config(command=self.on_tree_scroll)
 
         self.tree.heading('date', text='Date', anchor='w')
         self.tree.heading('type', text='Type', anchor='w')
@@ -218,6 +388,14 @@ class BrainDumpApp:
         self.tree_scroll_y.grid(row=0, column=1, sticky='ns')
         
         self.tree.bind('<<TreeviewSelect>>', self.on_entry_select)
+        self.tree.bind('<Configure>', self.on_tree_configure)
+        self.tree.bind('<MouseWheel>', self.on_tree_wheel) # Windows/macOS
+        self.tree.bind('<Button-4>', self.on_tree_wheel) # Linux
+        self.tree.bind('<Button-5>', self.on_tree_wheel) # Linux
+        self.tree.bind('<Up>', lambda e: self.move_selection(-1))
+        self.tree.bind('<Down>', lambda e: self.move_selection(1))
+        self.tree.bind('<Prior>', lambda e: self.move_selection(-self._visible_rows))
+        self.tree.bind('<Next>', lambda e: self.move_selection(self._visible_rows))
         
         # --- 3. Display Section (Right) ---
         # --- NEW: Re-architected with Canvas for scrolling ---
@@ -247,13 +425,93 @@ class BrainDumpApp:
         self.scrollable_content_frame.bind('<Configure>', self.on_frame_configure)
         self.display_canvas.bind('<Configure>', self.on_canvas_configure)
         
-        # Bind mouse wheel scrolling
-        self.display_canvas.bind_all("<MouseWheel>", self._on_mousewheel) # Windows/macOS
-        self.display_canvas.bind_all("<Button-4>", self._on_mousewheel) # Linux
-        self.display_canvas.bind_all("<Button-5>", self._on_mousewheel) # Linux
+        # Bind mouse wheel scrolling to the display widgets only (via the 'DisplayScroll' bindtag),
+        # so Tk routes wheel events straight to the right handler
+        self.root.bind_class('DisplayScroll', "<MouseWheel>", self._scroll_display) # Windows/macOS
+        self.root.bind_class('DisplayScroll', "<Button-4>", self._scroll_display) # Linux
+        self.root.bind_class('DisplayScroll', "<Button-5>", self._scroll_display) # Linux
+        self._add_display_scroll(self.display_frame)
 
+        # Let Tk draw the window skeleton first, then style it and load data
+        self.root.after_idle(self._deferred_init)
+
+    def _deferred_init(self):
+        """Second startup phase, run from the event loop once __init__ has returned and the window is up."""
+        self.configure_styles()
         self.show_welcome_message()
         self.load_entries()
+        self.io_pool.submit(trim_thumbnail_cache)
+
+    def configure_styles(self):
+        """Configures the dark-mode ttk styles."""
+        # General styles
+        self.style.configure('.',
+            font=('Helvetica', 10),
+            background=BG_COLOR,
+            foreground=TEXT_COLOR,
+            fieldbackground=ENTRY_BG,
+            bordercolor=BORDER_COLOR,
+            lightcolor=FRAME_COLOR,
+            darkcolor=BG_COLOR
+        )
+        self.style.configure('TFrame', background=BG_COLOR)
+        self.style.configure('TLabel', background=BG_COLOR, foreground=TEXT_COLOR)
+        self.style.configure('Header.TLabel', font=('Helvetica', 16, 'bold'), background=BG_COLOR)
+        self.style.configure('Meta.TLabel', font=('Helvetica', 9, 'italic'), foreground=LIGHT_TEXT, background=FRAME_COLOR)
+        self.style.configure('Bold.TLabel', font=('Helvetica', 10, 'bold'), background=FRAME_COLOR)
+
+        # Content Frame style
+        self.style.configure('Content.TFrame', background=FRAME_COLOR, relief=tk.SOLID, borderwidth=1, bordercolor=BORDER_COLOR)
+
+        # Button styles
+        self.style.configure('TButton', font=('Helvetica', 10, 'bold'), padding=8, relief=tk.FLAT, borderwidth=0)
+        self.style.map('TButton',
+            background=[('!active', ACCENT_COLOR), ('active', '#5aa0eb')],
+            foreground=[('!disabled', '#ffffff')])
+        
+        # Style for the "Paste" button
+        self.style.configure('Paste.TButton', font=('Helvetica', 10, 'bold'), padding=8, relief=tk.FLAT, borderwidth=0)
+        self.style.map('Paste.TButton',
+            background=[('!active', '#28a745'), ('active', '#34c759')], # Green
+            foreground=[('!disabled', '#ffffff')])
+
+        # Entry widget
+        self.style.configure('TEntry',
+            font=('Helvetica', 10),
+            padding=5,
+            relief=tk.FLAT,
+            borderwidth=1,
+            fieldbackground=ENTRY_BG,
+            foreground=TEXT_COLOR
+        )
+        self.style.map('TEntry',
+            bordercolor=[('focus', ACCENT_COLOR), ('!focus', BORDER_COLOR)],
+            fieldbackground=[('disabled', BG_COLOR)]
+        )
+        
+        # --- Treeview (List) Style ---
+        self.style.configure('Treeview',
+            background=FRAME_COLOR,
+            fieldbackground=FRAME_COLOR,
+            foreground=TEXT_COLOR,
+            rowheight=TREE_ROW_HEIGHT,
+            relief=tk.FLAT,
+            borderwidth=0)
+        self.style.map('Treeview',
+            background=[('selected', ACCENT_COLOR)],
+            foreground=[('selected', '#ffffff')]
+        )
+        self.style.configure('Treeview.Heading',
+            font=('Helvetica', 10, 'bold'),
+            padding=5,
+            relief=tk.FLAT,
+            background=SELECTED_BG,
+            foreground=TEXT_COLOR
+        )
+        self.style.map('Treeview.Heading',
+            background=[('!active', SELECTED_BG), ('active', FRAME_COLOR)],
+            foreground=[('!active', TEXT_COLOR)]
+        )
 
     # --- NEW: Functions for scrollable frame ---
     def on_frame_configure(self, event):
@@ -264,42 +522,50 @@ class BrainDumpApp:
         """Update the inner frame's width to match the canvas's width."""
         canvas_width = event.width
         self.display_canvas.itemconfig(self.canvas_window, width=canvas_width)
+        self._canvas_width = canvas_width # Cached for preview sizing, saves a winfo_width() round-trip
 
-    def _on_mousewheel(self, event):
-        """Handle mouse wheel scrolling."""
-        x, y = self.root.winfo_pointerxy()
-        widget_under_cursor = self.root.winfo_containing(x, y)
-        if not widget_under_cursor:
-            return
+    def _scroll_display(self, event):
+        """Handle mouse wheel scrolling over the display area."""
+        self.display_canvas.yview_scroll(self._wheel_delta(event), "units")
 
-        # Check if the widget is a descendant of the display_frame
-        parent = widget_under_cursor
-        while parent:
-            if parent == self.display_frame:
-                # Yes, scroll the canvas
-                if sys.platform == "win32":
-                    delta = -int(event.delta / 120)
-                elif sys.platform == "darwin":
-                    delta = event.delta
-                else: # Linux
-                    if event.num == 4:
-                        delta = -1
-                    else:
-                        delta = 1
-                
-                self.display_canvas.yview_scroll(delta, "units")
-                return # We handled it
-            
-            # Don't scroll the display_frame if we are over the list_frame
-            if parent == self.list_frame:
-                return # Let the list_frame's widgets handle it
-                
-            try:
-                parent = parent.winfo_parent()
-            except Exception:
-                break
+    def _add_display_scroll(self, widget):
+        """Adds the 'DisplayScroll' bindtag to widget and its descendants (text boxes keep their own scrolling)."""
+        if not isinstance(widget, tk.Text) and 'DisplayScroll' not in widget.bindtags():
+            widget.bindtags(widget.bindtags() + ('DisplayScroll',))
+        for child in widget.winfo_children():
+            self._add_display_scroll(child)
+
+    def _wheel_delta(self, event):
+        """Converts a mouse wheel event into a number of scroll units (negative = up)."""
+        if sys.platform == "win32":
+            return -int(event.delta / 120)
+        elif sys.platform == "darwin":
+            return event.delta
+        else: # Linux
+            if event.num == 4:
+                return -1
+            else:
+                return 1
     # ---------------------------------------------
 
+    def schedule_search(self, event=None):
+        """Reloads the entries list shortly after the user stops typing, so a burst of keystrokes runs one query."""
+        if event is not None and event.keysym in ('Return', 'KP_Enter'):
+            return # search_now already reloaded immediately
+        if self._search_after_id:
+            self.root.after_cancel(self._search_after_id)
+        self._search_after_id = self.root.after(200, self._run_scheduled_search)
+
+    def search_now(self, event=None):
+        """Reloads the entries list right away (on Enter), dropping any reload still pending from typing."""
+        if self._search_after_id:
+            self.root.after_cancel(self._search_after_id)
+        self._run_scheduled_search()
+
+    def _run_scheduled_search(self):
+        self._search_after_id = None
+        self.load_entries()
+
     def show_tooltip(self, text):
         if self.tooltip:
             self.tooltip.destroy()
@@ -322,52 +588,163 @@ class BrainDumpApp:
         try:
             os.makedirs(APP_DIR, exist_ok=True)
             os.makedirs(FILES_DIR, exist_ok=True)
+            os.makedirs(THUMBS_DIR, exist_ok=True)
         except OSError as e:
             messagebox.showerror("Error", f"Failed to create app directories: {e}")
             self.root.quit()
             
         try:
-            self.conn = sqlite3.connect(DB_FILE)
-            self.cursor = self.conn.cursor()
-            self.cursor.execute('''
-                CREATE TABLE IF NOT EXISTS entries (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    type TEXT NOT NULL,
-                    content TEXT NOT NULL,
-                    tags TEXT,
-                    filepath TEXT,
-                    timestamp DATETIME DEFAULT CURRENT_TIMESTAMP
-                )
-            ''')
+            # isolation_level=None: no implicit transactions, writes are grouped explicitly with self.txn()
+            # cached_statements: every fixed SQL string in the app stays prepared for the whole session
+            self.conn = sqlite3.connect(DB_FILE, isolation_level=None, cached_statements=256)
+            # WAL + NORMAL sync: far fewer fsyncs per commit, still safe for a local single-user app
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute("PRAGMA synchronous=NORMAL")
+            self.conn.execute("PRAGMA temp_store=MEMORY")
+            self.conn.execute("PRAGMA cache_size=-20000") # ~20 MB page cache
+            self.conn.execute("PRAGMA mmap_size=268435456") # Read through a 256 MB memory map instead of read() calls
             
-            # --- Add description column if it doesn't exist (for existing users) ---
-            try:
-                self.cursor.execute("ALTER TABLE entries ADD COLUMN description TEXT")
-                self.conn.commit()
-            except sqlite3.OperationalError as e:
-                if "duplicate column name" not in str(e):
-                    raise # Re-raise if it's not the error we expect
-            
-            self.conn.commit()
+            with self.txn():
+                self.conn.execute('''
+                    CREATE TABLE IF NOT EXISTS entries (
+                        id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        type TEXT NOT NULL,
+                        content TEXT NOT NULL,
+                        tags TEXT,
+                        filepath TEXT,
+                        timestamp DATETIME DEFAULT CURRENT_TIMESTAMP
+                    )
+                ''')
+                
+                # --- Add description column if it doesn't exist (for existing users) ---
+                columns = {row[1] for row in self.conn.execute("PRAGMA table_info(entries)")}
+                if 'description' not in columns:
+                    self.conn.execute("ALTER TABLE entries ADD COLUMN description TEXT")
+                
+                # --- One row per (entry, tag) so tag filtering can use an index ---
+                backfill_tags = self.conn.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'entry_tags'").fetchone() is None
+                self.conn.execute('''
+                    CREATE TABLE IF NOT EXISTS entry_tags (
+                        entry_id INTEGER NOT NULL,
+                        tag TEXT NOT NULL COLLATE NOCASE,
+                        PRIMARY KEY (entry_id, tag)
+                    )
+                ''')
+                self.conn.execute("CREATE INDEX IF NOT EXISTS idx_entry_tags_tag ON entry_tags(tag)")
+                
+                if backfill_tags: # First run with this table: index the tags of existing entries
+                    for entry_id, tags in self.conn.execute("SELECT id, tags FROM entries WHERE tags IS NOT NULL AND tags != ''").fetchall():
+                        self.save_entry_tags(entry_id, tags)
+                
+                # --- Full-text index over content/description, kept in sync by triggers ---
+                # Falls back to LIKE searching if this SQLite build lacks FTS5.
+                self.fts_available = True
+                try:
+                    rebuild_fts = self.conn.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'entries_fts'").fetchone() is None
+                    self.conn.execute(
+                        "CREATE VIRTUAL TABLE IF NOT EXISTS entries_fts USING fts5(content, description, content='entries', content_rowid='id')"
+                    )
+                    self.conn.execute('''
+                        CREATE TRIGGER IF NOT EXISTS entries_ai AFTER INSERT ON entries BEGIN
+                            INSERT INTO entries_fts(rowid, content, description) VALUES (new.id, new.content, new.description);
+                        END
+                    ''')
+                    self.conn.execute('''
+                        CREATE TRIGGER IF NOT EXISTS entries_ad AFTER DELETE ON entries BEGIN
+                            INSERT INTO entries_fts(entries_fts, rowid, content, description) VALUES ('delete', old.id, old.content, old.description);
+                        END
+                    ''')
+                    # Only content/description changes need re-indexing (not e.g. the preview column)
+                    au_sql = self.conn.execute("SELECT sql FROM sqlite_master WHERE type = 'trigger' AND name = 'entries_au'").fetchone()
+                    if au_sql and 'UPDATE OF' not in au_sql[0]:
+                        self.conn.execute("DROP TRIGGER entries_au") # Older databases: fired on every column
+                    self.conn.execute('''
+                        CREATE TRIGGER IF NOT EXISTS entries_au AFTER UPDATE OF content, description ON entries BEGIN
+                            INSERT INTO entries_fts(entries_fts, rowid, content, description) VALUES ('delete', old.id, old.content, old.description);
+                            INSERT INTO entries_fts(rowid, content, description) VALUES (new.id, new.content, new.description);
+                        END
+                    ''')
+                    if rebuild_fts: # First run with FTS: index the existing entries
+                        self.conn.execute("INSERT INTO entries_fts(entries_fts) VALUES ('rebuild')")
+                except sqlite3.OperationalError as e:
+                    if "no such module" not in str(e):
+                        raise
+                    self.fts_available = False
+                
+                # --- List preview, computed once on write instead of on every list query ---
+                # Set up after the FTS triggers, so the backfill below doesn't re-index every entry.
+                # Note previews are the first line, capped at 50 chars, with "..." if anything was cut.
+                preview_expr = """
+                    CASE WHEN type = 'note' THEN
+                        substr(replace(substr(content, 1, instr(content || char(10), char(10)) - 1), char(13), ''), 1, 50) ||
+                        CASE WHEN length(content) > 50 OR instr(content, char(10)) > 0 THEN '...' ELSE '' END
+                    ELSE content END"""
+                if 'preview' not in columns:
+                    self.conn.execute("ALTER TABLE entries ADD COLUMN preview TEXT")
+                    self.conn.execute(f"UPDATE entries SET preview = {preview_expr}")
+                self.conn.execute(f'''
+                    CREATE TRIGGER IF NOT EXISTS entries_preview_ai AFTER INSERT ON entries BEGIN
+                        UPDATE entries SET preview = {preview_expr} WHERE id = new.id;
+                    END
+                ''')
+                self.conn.execute(f'''
+                    CREATE TRIGGER IF NOT EXISTS entries_preview_au AFTER UPDATE OF type, content ON entries BEGIN
+                        UPDATE entries SET preview = {preview_expr} WHERE id = new.id;
+                    END
+                ''')
+                
+                # --- Covering index for the newest-first listing: no sort and no table lookups ---
+                self.conn.execute("DROP INDEX IF EXISTS idx_entries_ts") # Superseded by idx_entries_list
+                self.conn.execute("CREATE INDEX IF NOT EXISTS idx_entries_list ON entries(timestamp DESC, type, preview)")
         except sqlite3.Error as e:
             messagebox.showerror("Database Error", f"Failed to initialize database: {e}")
             self.root.quit()
 
+    @contextmanager
+    def txn(self):
+        """Runs the enclosed statements as one transaction (a single commit), rolling back on error."""
+        self.conn.execute("BEGIN")
+        try:
+            yield
+        except BaseException:
+            self.conn.execute("ROLLBACK")
+            raise
+        self.conn.execute("COMMIT")
+
+    def save_entry_tags(self, entry_id, tags):
+        """Stores each comma-separated tag of an entry as its own row in entry_tags (run inside the caller's transaction)."""
+        tag_list = {tag.strip() for tag in tags.split(',') if tag.strip()}
+        self.conn.executemany(
+            "INSERT OR IGNORE INTO entry_tags (entry_id, tag) VALUES (?, ?)",
+            [(entry_id, tag) for tag in tag_list]
+        )
+
+    def get_note(self):
+        """Returns the note box text without Tk's trailing newline; an empty box is detected without copying its contents."""
+        if self.note_text.compare("1.0", "==", "end-1c"):
+            return ""
+        return self.note_text.get("1.0", "end-1c")
+
+    def get_tags(self):
+        """Returns the normalized (stripped, lowercase) tags input."""
+        return self.tag_entry.get().strip().lower()
+
     def add_note(self):
         """Saves a text note to the database."""
-        content = self.note_text.get("1.0", tk.END).strip()
-        tags = self.tag_entry.get().strip().lower()
+        content = self.get_note().strip()
+        tags = self.get_tags()
         
         if not content:
             messagebox.showwarning("Empty Note", "Cannot save an empty note.")
             return
             
         try:
-            self.cursor.execute(
-                "INSERT INTO entries (type, content, tags) VALUES (?, ?, ?)",
-                ('note', content, tags)
-            )
-            self.conn.commit()
+            with self.txn():
+                cursor = self.conn.execute(
+                    "INSERT INTO entries (type, content, tags) VALUES (?, ?, ?)",
+                    ('note', content, tags)
+                )
+                self.save_entry_tags(cursor.lastrowid, tags)
             
             self.note_text.delete("1.0", tk.END)
             self.tag_entry.delete(0, tk.END)
@@ -383,23 +760,63 @@ class BrainDumpApp:
         if not filepath:
             return
             
-        tags = self.tag_entry.get().strip().lower()
-        description = self.note_text.get("1.0", tk.END).strip()
+        tags = self.get_tags()
+        description = self.get_note().strip()
         filename = os.path.basename(filepath)
         
+        # Copy in the background; the entry is saved once the copy finishes
+        self.run_in_background(
+            self.copy_file_to_storage, filepath, filename,
+            on_done=lambda future: self.on_file_stored(future, filename, tags, description, "Failed to copy file")
+        )
+
+    def run_in_background(self, func, *args, on_done, pool=None):
+        """Runs func(*args) on a worker pool (the I/O pool by default) and calls on_done(future) back on the Tk thread."""
+        future = (pool or self.io_pool).submit(func, *args)
+        future.add_done_callback(lambda f: self._completions.put((on_done, f)))
+        self._jobs_in_flight += 1
+        if self._completion_poll_id is None:
+            self._completion_poll_id = self.root.after(COMPLETION_POLL_MS, self._poll_completions)
+        return future
+
+    def _poll_completions(self):
+        """Runs the callbacks of finished background jobs, polling again while any are still running."""
+        self._completion_poll_id = None
+        self.run_completions()
+        if self._jobs_in_flight:
+            self._completion_poll_id = self.root.after(COMPLETION_POLL_MS, self._poll_completions)
+
+    def run_completions(self):
+        """Runs on_done(future) for every background job that has finished (Tk thread only)."""
+        while True:
+            try:
+                on_done, future = self._completions.get_nowait()
+            except queue.Empty:
+                return
+            self._jobs_in_flight -= 1
+            on_done(future)
+
+    def on_file_stored(self, future, filename, tags, description, error_message):
+        """Tk-thread completion of a background copy/save: records the stored file as a new entry."""
         try:
-            new_filepath = self.copy_file_to_storage(filepath, filename)
-            if not new_filepath:
-                return # Error was already shown
+            new_filepath = future.result()
+        except Exception as e:
+            messagebox.showerror("File Error", f"{error_message}: {e}")
+            return
 
-            self.cursor.execute(
-                "INSERT INTO entries (type, content, tags, filepath, description) VALUES (?, ?, ?, ?, ?)",
-                ('file', filename, tags, new_filepath, description) # Store base filename in content
-            )
-            self.conn.commit()
+        try:
+            with self.txn():
+                cursor = self.conn.execute(
+                    "INSERT INTO entries (type, content, tags, filepath, description) VALUES (?, ?, ?, ?, ?)",
+                    ('file', filename, tags, new_filepath, description) # Store base filename in content
+                )
+                self.save_entry_tags(cursor.lastrowid, tags)
             
-            self.note_text.delete("1.0", tk.END)
-            self.tag_entry.delete(0, tk.END)
+            # Only clear the inputs if they still hold what was submitted; the user may have typed since
+            if self.get_note().strip() == description:
+                self.note_text.delete("1.0", tk.END)
+            if self.get_tags() == tags:
+                self.tag_entry.delete(0, tk.END)
             # messagebox.showinfo("Success", "File added!") # Less intrusive
             self.load_entries()
         except sqlite3.Error as e:
@@ -416,9 +833,11 @@ class BrainDumpApp:
             messagebox.showerror("Feature Disabled", "This feature requires the 'Pillow' library.\n\nPlease install it using: pip install Pillow")
             return
         
+        from PIL import ImageGrab
+        
         # 1. Try to get image data directly
         try:
-            im = ImageGrab.grabclipboard()
+            im = ImageGrab.grabclipboard() if clipboard_may_have_image() else None
         except Exception as e:
             im = None
             try:
@@ -452,31 +871,18 @@ class BrainDumpApp:
 
         # 3. Check if the text is a valid file path to an image
         cleaned_path = clipboard_text.strip().strip('"')
-        valid_image_extensions = ('.png', '.jpg', '.jpeg', '.bmp', '.gif')
+        ext = os.path.splitext(cleaned_path)[1].lower() # Only the suffix, not the whole clipboard text
         
-        if os.path.exists(cleaned_path) and os.path.isfile(cleaned_path) and cleaned_path.lower().endswith(valid_image_extensions):
+        if ext in IMAGE_EXTENSIONS and os.path.isfile(cleaned_path):
             # --- SUCCESS: Found a file path to an image ---
-            tags = self.tag_entry.get().strip().lower()
-            description = self.note_text.get("1.0", tk.END).strip()
+            tags = self.get_tags()
+            description = self.get_note().strip()
             filename = os.path.basename(cleaned_path)
             
-            try:
-                new_filepath = self.copy_file_to_storage(cleaned_path, filename)
-                if not new_filepath:
-                    return
-
-                self.cursor.execute(
-                    "INSERT INTO entries (type, content, tags, filepath, description) VALUES (?, ?, ?, ?, ?)",
-                    ('file', filename, tags, new_filepath, description)
-                )
-                self.conn.commit()
-                
-                self.note_text.delete("1.0", tk.END)
-                self.tag_entry.delete(0, tk.END)
-                # messagebox.showinfo("Success", "Image file from clipboard path added!") # Less intrusive
-                self.load_entries()
-            except Exception as e:
-                messagebox.showerror("Database Error", f"Failed to save file reference: {e}")
+            self.run_in_background(
+                self.copy_file_to_storage, cleaned_path, filename,
+                on_done=lambda future: self.on_file_stored(future, filename, tags, description, "Failed to copy file")
+            )
         else:
             # --- NOT an image, NOT a file path. Just paste the text. ---
             self.note_text.insert(tk.INSERT, clipboard_text)
@@ -484,96 +890,185 @@ class BrainDumpApp:
 
     def save_pasted_image_data(self, im):
         """Helper function to save raw image data from clipboard."""
-        tags = self.tag_entry.get().strip().lower()
-        description = self.note_text.get("1.0", tk.END).strip()
+        tags = self.get_tags()
+        description = self.get_note().strip()
         timestamp = datetime.datetime.now().strftime("%Y%m%d%H%M%S")
         filename = f"paste_{timestamp}.png"
-        new_filepath = os.path.join(FILES_DIR, filename)
         
-        try:
-            im.save(new_filepath, 'PNG')
-        except Exception as e:
-            messagebox.showerror("File Error", f"Failed to save pasted image: {e}")
-            return
+        # Encode in the background; large screenshots can take a while
+        self.run_in_background(
+            self.write_pasted_image, im, filename,
+            on_done=lambda future: self.on_file_stored(future, filename, tags, description, "Failed to save pasted image")
+        )
 
+    def write_pasted_image(self, im, filename):
+        """Writes a pasted image as PNG into storage. Runs on the I/O pool; returns the path written."""
+        new_filepath = reserve_storage_path(filename)
         try:
-            self.cursor.execute(
-                "INSERT INTO entries (type, content, tags, filepath, description) VALUES (?, ?, ?, ?, ?)",
-                ('file', filename, tags, new_filepath, description)
-            )
-            self.conn.commit()
-            
-            self.note_text.delete("1.0", tk.END)
-            self.tag_entry.delete(0, tk.END)
-            # messagebox.showinfo("Success", "Pasted image saved as a new file!") # Less intrusive
-            self.load_entries()
-        except sqlite3.Error as e:
-            messagebox.showerror("Database Error", f"Failed to save image reference: {e}")
-
+            # Pastes favour speed: 256 KB write buffer and fast zlib level instead of the default 6
+            with open(new_filepath, 'wb', buffering=1 << 18) as f:
+                im.save(f, 'PNG', compress_level=1, optimize=False)
+        except BaseException:
+            os.remove(new_filepath) # Don't leave a partial file behind
+            raise
+        return new_filepath
 
     def copy_file_to_storage(self, filepath, filename):
-        """Copies a file to the app's internal storage, handling conflicts."""
+        """Copies a file to the app's internal storage, handling conflicts. Runs on the I/O pool; raises on failure."""
+        new_filepath = reserve_storage_path(filename)
         try:
-            new_filepath = os.path.join(FILES_DIR, filename)
-            if os.path.exists(new_filepath):
-                base, ext = os.path.splitext(filename)
-                timestamp = datetime.datetime.now().strftime("%Y%m%d%H%M%S")
-                new_filename = f"{base}_{timestamp}{ext}"
-                new_filepath = os.path.join(FILES_DIR, new_filename)
-                
-            shutil.copy2(filepath, new_filepath)
-            return new_filepath
-        except Exception as e:
-            messagebox.showerror("File Error", f"Failed to copy file: {e}")
-            return None
+            copy_file_fast(filepath, new_filepath)
+        except BaseException:
+            os.remove(new_filepath) # Don't leave a partial file behind
+            raise
+        return new_filepath
 
-    def load_entries(self):
-        """Loads entries from the database into the Treeview, filtering by search."""
+    def build_list_queries(self):
+        """
+        Builds the entries-list SELECT for each filter combination once, keyed by
+        (has_search, has_tag_filter), so load_entries always reuses the same SQL text
+        and hits sqlite3's prepared-statement cache.
+        """
+        # Date is formatted by SQLite so no per-row parsing happens in Python.
+        # Every column read here is in idx_entries_list, so the listing never touches the table itself.
+        base_query = "SELECT id, type, strftime('%Y-%m-%d %H:%M', timestamp), preview FROM entries"
+        if self.fts_available:
+            search_clause = "id IN (SELECT rowid FROM entries_fts WHERE entries_fts MATCH ?)"
+        else:
+            search_clause = "(content LIKE ? OR description LIKE ?)"
+        # Prefix match so the entry_tags.tag index can be used
+        tag_clause = "id IN (SELECT entry_id FROM entry_tags WHERE tag LIKE ?)"
+        
+        queries = {}
+        for has_search in (False, True):
+            for has_tag in (False, True):
+                where_clauses = []
+                if has_search:
+                    where_clauses.append(search_clause)
+                if has_tag:
+                    where_clauses.append(tag_clause)
+                where = f" WHERE {' AND '.join(where_clauses)}" if where_clauses else ""
+                queries[(has_search, has_tag)] = f"{base_query}{where} ORDER BY timestamp DESC LIMIT ? OFFSET ?"
+        return queries
+
+    def load_entries(self, append=False):
+        """Loads a page of entries from the database into the list, filtering by search.
+
+        With append=True the next page is added below the rows already loaded.
+        """
         search_term = self.search_entry.get().strip()
         # --- NEW: Get tag filter term ---
         tag_filter_term = self.tag_filter_entry.get().strip().lower()
         
-        # Clear existing tree
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-            
         try:
-            # --- NEW: Dynamic query building ---
-            base_query = "SELECT id, type, content, tags, timestamp FROM entries"
-            where_clauses = []
             params = []
-            
             if search_term:
-                where_clauses.append("(content LIKE ? OR description LIKE ?)")
-                params.extend([f"%{search_term}%", f"%{search_term}%"])
-                
+                if self.fts_available:
+                    params.append(build_fts_query(search_term))
+                else:
+                    params.extend([f"%{search_term}%", f"%{search_term}%"])
             if tag_filter_term:
-                where_clauses.append("tags LIKE ?")
-                params.append(f"%{tag_filter_term}%")
+                params.append(f"{tag_filter_term}%")
+            params.extend([PAGE_SIZE, len(self._rows) if append else 0])
             
-            if where_clauses:
-                query = f"{base_query} WHERE {' AND '.join(where_clauses)} ORDER BY timestamp DESC"
-            else:
-                query = f"{base_query} ORDER BY timestamp DESC"
-                
-            self.cursor.execute(query, tuple(params))
-                
-            for row in self.cursor.fetchall():
-                entry_id, type, content, tags, timestamp = row
-                
-                ts_date = datetime.datetime.strptime(timestamp, '%Y-%m-%d %H:%M:%S').strftime('%Y-%m-%d %H:%M')
-                
-                if type == 'note':
-                    preview = content.split('\n')[0].replace('\r', '')[:50]
-                    if len(content) > 50 or '\n' in content:
-                        preview += "..."
-                else: # 'file'
-                    preview = content # Content is now the filename
-                    
-                self.tree.insert('', 'end', iid=entry_id, values=(ts_date, type.capitalize(), preview))
-                
+            query = self._list_queries[(bool(search_term), bool(tag_filter_term))]
+            # Build the Treeview values tuples once per fetch, not on every scroll
+            rows = [(entry_id, (ts_date, type.capitalize(), preview)) for entry_id, type, ts_date, preview in self.conn.execute(query, tuple(params))]
         except sqlite3.Error as e:
             messagebox.showerror("Database Error", f"Failed to load entries: {e}")
+            return
+            
+        # A full page means there may be more rows to fetch
+        self._has_more = len(rows) == PAGE_SIZE
+        if append:
+            self._rows.extend(rows)
+            self.show_rows(self._view_top)
+        else:
+            self._rows = rows
+            self.show_rows(0)
+
+    def show_rows(self, top):
+        """Fills the Treeview with the window of loaded rows starting at index top."""
+        self._visible_rows = self._visible_row_count()
+        total = len(self._rows)
+        top = max(0, min(top, total - self._visible_rows))
+        self._view_top = top
+        window = self._rows[top:top + self._visible_rows]
+        
+        # Clear existing tree (one Tcl call for all rows)
+        self.tree.delete(*self.tree.get_children())
+        self._iid_to_entry.clear()
+        
+        selected_iid = None
+        selected_entry_id = self._selected_entry_id
+        # Local aliases keep attribute lookups out of the insert loop
+        insert = self.tree.insert
+        iid_to_entry = self._iid_to_entry
+        for entry_id, values in window:
+            iid = insert('', 'end', values=values)
+            iid_to_entry[iid] = entry_id
+            if entry_id == selected_entry_id:
+                selected_iid = iid
+        
+        if selected_iid:
+            self.tree.selection_set(selected_iid)
+            self.tree.focus(selected_iid)
+        
+        # The scrollbar shows where the window sits within all loaded rows
+        if total:
+            self.tree_scroll_y.set(top / total, (top + len(window)) / total)
+        else:
+            self.tree_scroll_y.set(0, 1)
+            
+        # Reaching the end of what's loaded pulls in the next page
+        if self._has_more and top + self._visible_rows >= total:
+            self.load_entries(append=True)
+
+    def _visible_row_count(self):
+        """Number of rows that fit in the Treeview below its heading."""
+        return max(1, self.tree.winfo_height() // TREE_ROW_HEIGHT - 1)
+
+    def on_tree_configure(self, event):
+        """Re-fills the list when a resize changes how many rows fit."""
+        if self._visible_row_count() != self._visible_rows:
+            self.show_rows(self._view_top)
+
+    def on_tree_scroll(self, *args):
+        """Scrollbar callback: moves the visible window over the loaded rows."""
+        if args[0] == 'moveto':
+            top = int(float(args[1]) * len(self._rows))
+        else: # ('scroll', n, 'units' or 'pages')
+            step = int(args[1])
+            if args[2] == 'pages':
+                step *= self._visible_rows
+            top = self._view_top + step
+        self.show_rows(top)
+
+    def on_tree_wheel(self, event):
+        """Scrolls the entries list by three rows per wheel notch."""
+        self.show_rows(self._view_top + 3 * self._wheel_delta(event))
+        return "break"
+
+    def move_selection(self, step):
+        """Keyboard navigation over all loaded rows, scrolling the window as needed."""
+        if not self._rows:
+            return "break"
+        selected_items = self.tree.selection()
+        if selected_items and selected_items[0] in self._iid_to_entry:
+            index = self._view_top + self.tree.index(selected_items[0]) + step
+        else:
+            index = self._view_top
+        index = max(0, min(index, len(self._rows) - 1))
+        
+        if index < self._view_top:
+            self.show_rows(index)
+        elif index >= self._view_top + self._visible_rows:
+            self.show_rows(index - self._visible_rows + 1)
+        
+        iid = self.tree.get_children()[index - self._view_top]
+        self.tree.selection_set(iid)
+        self.tree.focus(iid)
+        return "break"
 
     def on_entry_select(self, event):
         """Callback when an entry is selected from the Treeview."""
@@ -581,160 +1076,277 @@ class BrainDumpApp:
         if not selected_items:
             return
             
-        entry_id = selected_items[0] # The iid is the entry_id
-        
+        entry_id = self._iid_to_entry.get(selected_items[0])
+        if entry_id is None or entry_id == self._selected_entry_id:
+            return # Stale item, or the entry already shown being re-highlighted after a scroll
+        self._selected_entry_id = entry_id
+        self._schedule_display(entry_id)
+
+    def _schedule_display(self, entry_id):
+        """Shows entry_id shortly after the selection settles, so arrowing through the list renders only where it stops."""
+        if self._display_pending_id:
+            self.root.after_cancel(self._display_pending_id)
+        self._display_pending_id = self.root.after(40, self._do_display, entry_id)
+
+    def _do_display(self, entry_id):
+        self._display_pending_id = None
+        if entry_id != self._selected_entry_id:
+            return # Selection was reset (e.g. the entry was deleted) before we got here
         try:
-            self.cursor.execute("SELECT type, content, tags, filepath, timestamp, description FROM entries WHERE id = ?", (entry_id,))
-            entry = self.cursor.fetchone()
+            entry = self.conn.execute("SELECT type, content, tags, filepath, timestamp, description FROM entries WHERE id = ?", (entry_id,)).fetchone()
             if entry:
                 self.display_entry(entry_id, entry)
         except sqlite3.Error as e:
             messagebox.showerror("Database Error", f"Failed to fetch entry: {e}")
 
     def clear_display_frame(self):
-        """Clears the scrollable content frame."""
-        for widget in self.scrollable_content_frame.winfo_children():
-            widget.destroy()
+        """Resets the display area: drops the current preview and scrolls back to the top."""
         self.photo_image = None
+        # Any preview still decoding is for the entry being cleared away
+        if self._pending_preview:
+            self._pending_preview.cancel()
+            self._pending_preview = None
         # Reset scroll position
         self.display_canvas.yview_moveto(0)
 
     def show_welcome_message(self):
         """Displays a welcome message in the display area."""
         self.clear_display_frame()
+        if self._entry_frame is not None:
+            self._entry_frame.grid_remove()
         
-        ttk.Label(
-            self.scrollable_content_frame,
-            text="Welcome to your Brain Dump!",
-            style='Header.TLabel',
-            background=FRAME_COLOR
-        ).grid(row=0, column=0, pady=20, padx=20, sticky='w')
-        
-        info_text = "• Add notes, files, or paste images using the panel on the left.\n" \
-                    "• Your entries will be saved locally on your computer.\n" \
-                    "• Select an item from the list to view it here.\n" \
-                    "• Use the search and tag filters to find your entries."
-        
-        ttk.Label(
-            self.scrollable_content_frame,
-            text=info_text,
-            background=FRAME_COLOR,
-            justify='left'
-        ).grid(row=1, column=0, pady=10, padx=20, sticky='w')
+        if self._welcome_frame is None:
+            self._welcome_frame = ttk.Frame(self.scrollable_content_frame, style='Content.TFrame')
+            ttk.Label(
+                self._welcome_frame,
+                text="Welcome to your Brain Dump!",
+                style='Header.TLabel',
+                background=FRAME_COLOR
+            ).grid(row=0, column=0, pady=20, padx=20, sticky='w')
+            
+            info_text = "• Add notes, files, or paste images using the panel on the left.\n" \
+                        "• Your entries will be saved locally on your computer.\n" \
+                        "• Select an item from the list to view it here.\n" \
+                        "• Use the search and tag filters to find your entries."
+            
+            ttk.Label(
+                self._welcome_frame,
+                text=info_text,
+                background=FRAME_COLOR,
+                justify='left'
+            ).grid(row=1, column=0, pady=10, padx=20, sticky='w')
+            self._add_display_scroll(self._welcome_frame)
+        self._welcome_frame.grid(row=0, column=0, sticky='nsew')
 
-    def display_entry(self, entry_id, entry_data):
-        """Displays the selected entry (note or file) in the main display area."""
-        self.clear_display_frame()
-        
-        type, content, tags, filepath, timestamp, description = entry_data
+    def build_entry_view(self):
+        """
+        Creates the widgets used to show an entry. They are built once and reused:
+        display_entry only reconfigures them and hides the ones the entry doesn't need.
+        """
+        frame = self._entry_frame = ttk.Frame(self.scrollable_content_frame, style='Content.TFrame')
+        frame.columnconfigure(0, weight=1)
         
         # Frame for metadata
-        meta_frame = ttk.Frame(self.scrollable_content_frame, style='Content.TFrame')
+        meta_frame = ttk.Frame(frame, style='Content.TFrame')
         meta_frame.grid(row=0, column=0, sticky='ew', pady=(5, 10), padx=5)
-        
-        ts_date = datetime.datetime.strptime(timestamp, '%Y-%m-%d %H:%M:%S').strftime('%c')
-        
         meta_frame.columnconfigure(1, weight=1)
         ttk.Label(meta_frame, text="Type:", style='Bold.TLabel').grid(row=0, column=0, sticky='nw', padx=5, pady=2)
-        ttk.Label(meta_frame, text=type.capitalize(), style='Meta.TLabel', foreground=TEXT_COLOR, wraplength=400).grid(row=0, column=1, sticky='w', padx=5, pady=2)
+        self._tpl_type_label = ttk.Label(meta_frame, style='Meta.TLabel', foreground=TEXT_COLOR, wraplength=400)
+        self._tpl_type_label.grid(row=0, column=1, sticky='w', padx=5, pady=2)
         
         ttk.Label(meta_frame, text="Saved:", style='Bold.TLabel').grid(row=1, column=0, sticky='nw', padx=5, pady=2)
-        ttk.Label(meta_frame, text=ts_date, style='Meta.TLabel', wraplength=400).grid(row=1, column=1, sticky='w', padx=5, pady=2)
+        self._tpl_saved_label = ttk.Label(meta_frame, style='Meta.TLabel', wraplength=400)
+        self._tpl_saved_label.grid(row=1, column=1, sticky='w', padx=5, pady=2)
         
-        if tags:
-            ttk.Label(meta_frame, text="Tags:", style='Bold.TLabel').grid(row=2, column=0, sticky='nw', padx=5, pady=2)
-            ttk.Label(meta_frame, text=tags, style='Meta.TLabel', wraplength=400).grid(row=2, column=1, sticky='w', padx=5, pady=2)
+        self._tpl_tags_caption = ttk.Label(meta_frame, text="Tags:", style='Bold.TLabel')
+        self._tpl_tags_caption.grid(row=2, column=0, sticky='nw', padx=5, pady=2)
+        self._tpl_tags_label = ttk.Label(meta_frame, style='Meta.TLabel', wraplength=400)
+        self._tpl_tags_label.grid(row=2, column=1, sticky='w', padx=5, pady=2)
         
-        ttk.Separator(self.scrollable_content_frame, orient='horizontal').grid(row=1, column=0, sticky='ew', pady=5, padx=5)
+        ttk.Separator(frame, orient='horizontal').grid(row=1, column=0, sticky='ew', pady=5, padx=5)
         
-        content_frame = ttk.Frame(self.scrollable_content_frame, style='Content.TFrame')
+        content_frame = self._tpl_content_frame = ttk.Frame(frame, style='Content.TFrame')
         content_frame.grid(row=2, column=0, sticky='nsew')
         content_frame.columnconfigure(0, weight=1)
+        
+        # Note entries
+        self._tpl_note_text = scrolledtext.ScrolledText(
+            content_frame, wrap=tk.WORD, font=('Helvetica', 12),
+            relief=tk.FLAT, bg=FRAME_COLOR, fg=TEXT_COLOR,
+            bd=0, highlightthickness=0, height=25 # Give it a default height
+        )
+        self._tpl_note_text.grid(row=0, column=0, sticky='ew', padx=5)
+        
+        # File entries: image preview or file name, then location, description and buttons
+        self._tpl_file_image_label = ttk.Label(content_frame, background=FRAME_COLOR, foreground=LIGHT_TEXT)
+        self._tpl_file_image_label.grid(row=1, column=0, pady=10)
+        self._tpl_file_name_label = ttk.Label(content_frame, font=('Helvetica', 14, 'bold'), background=FRAME_COLOR)
+        self._tpl_file_name_label.grid(row=2, column=0, pady=10)
+        
+        self._tpl_location_label = ttk.Label(content_frame, font=('Helvetica', 9, 'italic'), foreground=LIGHT_TEXT, background=FRAME_COLOR, wraplength=500)
+        self._tpl_location_label.grid(row=3, column=0, pady=5, sticky='w', padx=5)
+        
+        self._tpl_desc_separator = ttk.Separator(content_frame, orient='horizontal')
+        self._tpl_desc_separator.grid(row=4, column=0, sticky='ew', pady=(10, 5), padx=5)
+        self._tpl_desc_caption = ttk.Label(content_frame, text="Note:", style='Bold.TLabel', background=FRAME_COLOR)
+        self._tpl_desc_caption.grid(row=5, column=0, sticky='w', padx=5, pady=(5,0))
+        
+        self._tpl_desc_frame = ttk.Frame(content_frame, style='Content.TFrame')
+        self._tpl_desc_frame.grid(row=6, column=0, sticky='ew', pady=5, padx=5)
+        self._tpl_desc_frame.columnconfigure(0, weight=1)
+        self._tpl_desc_text = scrolledtext.ScrolledText(
+            self._tpl_desc_frame, wrap=tk.WORD, font=('Helvetica', 11),
+            relief=tk.FLAT, bg=FRAME_COLOR, fg=TEXT_COLOR,
+            bd=0, highlightthickness=0, height=10 # Default height
+        )
+        self._tpl_desc_text.grid(row=0, column=0, sticky='ew', padx=5, pady=5)
+        
+        self._tpl_button_pack = ttk.Frame(content_frame, style='Content.TFrame')
+        self._tpl_button_pack.grid(row=7, column=0, pady=20)
+        self._tpl_open_btn = ttk.Button(self._tpl_button_pack, text="Open File", command=self._cb_open_file, style='TButton')
+        self._tpl_open_btn.pack(side=tk.LEFT, padx=5)
+        self._tpl_open_dir_btn = ttk.Button(self._tpl_button_pack, text="Open File Location", command=self._cb_open_dir, style='TButton')
+        self._tpl_open_dir_btn.pack(side=tk.LEFT, padx=5)
+        
+        # Delete button at the bottom (inside scrollable frame)
+        self._tpl_del_btn = ttk.Button(frame, text="Delete This Entry", command=self._cb_delete)
+        self._tpl_del_btn.grid(row=3, column=0, pady=10, padx=5, sticky='se')
+        
+        self._add_display_scroll(frame)
+
+    def _cb_open_file(self):
+        self.open_file_externally(self._current_filepath)
+
+    def _cb_open_dir(self):
+        self.open_file_location(self._current_filepath)
+
+    def _cb_delete(self):
+        self.delete_entry(self._current_entry_id)
+
+    def _set_readonly_text(self, widget, text):
+        """Replaces the contents of a disabled text widget."""
+        widget.configure(state=tk.NORMAL)
+        widget.delete("1.0", tk.END)
+        widget.insert("1.0", text)
+        widget.configure(state=tk.DISABLED)
+
+    def display_entry(self, entry_id, entry_data):
+        """Displays the selected entry (note or file) in the main display area."""
+        self.clear_display_frame()
+        if self._entry_frame is None:
+            self.build_entry_view()
+        if self._welcome_frame is not None:
+            self._welcome_frame.grid_remove()
+        
+        type, content, tags, filepath, timestamp, description = entry_data
+        
+        ts_date = datetime.datetime.fromisoformat(timestamp).strftime('%c')
+        self._tpl_type_label.configure(text=type.capitalize())
+        self._tpl_saved_label.configure(text=ts_date)
+        
+        if tags:
+            self._tpl_tags_label.configure(text=tags)
+            self._tpl_tags_caption.grid()
+            self._tpl_tags_label.grid()
+        else:
+            self._tpl_tags_caption.grid_remove()
+            self._tpl_tags_label.grid_remove()
+        
+        note_widgets = (self._tpl_note_text,)
+        file_widgets = (self._tpl_file_image_label, self._tpl_file_name_label, self._tpl_location_label,
+                        self._tpl_desc_separator, self._tpl_desc_caption, self._tpl_desc_frame, self._tpl_button_pack)
+        for widget in file_widgets if type == 'note' else note_widgets:
+            widget.grid_remove()
+        self._tpl_file_image_label.configure(image='') # Drop the previous preview
 
         if type == 'note':
-            note_display = scrolledtext.ScrolledText(
-                content_frame, wrap=tk.WORD, font=('Helvetica', 12),
-                relief=tk.FLAT, bg=FRAME_COLOR, fg=TEXT_COLOR,
-                bd=0, highlightthickness=0, height=25 # Give it a default height
-            )
-            note_display.insert("1.0", content)
-            note_display.config(state=tk.DISABLED)
-            note_display.grid(row=0, column=0, sticky='ew', padx=5)
+            self._set_readonly_text(self._tpl_note_text, content)
+            self._tpl_note_text.grid()
             
         elif type == 'file':
-            is_image = False
-            if PIL_AVAILABLE and filepath and filepath.lower().endswith(('.png', '.jpg', '.jpeg', '.gif', '.bmp')):
-                is_image = True
+            is_image = PIL_AVAILABLE and bool(filepath) and os.path.splitext(filepath)[1].lower() in IMAGE_EXTENSIONS
             
-            row_counter = 0
+            self._tpl_file_name_label.configure(text=content)
             if is_image:
-                try:
-                    img = Image.open(filepath)
-                    img_width, img_height = img.size
-                    
-                    # Simple resize logic: fit to a max width (calc from canvas)
-                    max_width = self.display_canvas.winfo_width() - 20
-                    if max_width < 100: max_width = 500 # Default if canvas not ready
-                    
-                    if img_width > max_width:
-                        ratio = max_width / float(img_width)
-                        new_height = int(img_height * ratio)
-                        img = img.resize((int(max_width), new_height), Image.Resampling.LANCZOS)
-                    
-                    self.photo_image = ImageTk.PhotoImage(img)
-                    preview_label = ttk.Label(content_frame, image=self.photo_image, background=FRAME_COLOR)
-                    preview_label.grid(row=row_counter, column=0, pady=10); row_counter +=1
-                except Exception as e:
-                    ttk.Label(content_frame, text=f"Error loading image: {e}", background=FRAME_COLOR, foreground='#ff8a80').grid(row=row_counter, column=0, pady=5); row_counter +=1
-                    ttk.Label(content_frame, text=content, font=('Helvetica', 14, 'bold'), background=FRAME_COLOR).grid(row=row_counter, column=0, pady=10); row_counter +=1
+                # Placeholder; the image is decoded off the Tk thread and swapped in when ready.
+                # The file name is only shown if the preview fails (see show_preview_error).
+                self._tpl_file_image_label.configure(text="Loading preview...", foreground=LIGHT_TEXT)
+                self._tpl_file_image_label.grid()
+                self._tpl_file_name_label.grid_remove()
+                self.request_preview_image(self._tpl_file_image_label, filepath)
             else:
-                ttk.Label(content_frame, text=content, font=('Helvetica', 14, 'bold'), background=FRAME_COLOR).grid(row=row_counter, column=0, pady=10); row_counter +=1
+                self._tpl_file_name_label.grid()
+                self._tpl_file_image_label.grid_remove()
             
-            ttk.Label(content_frame, text=f"Location: {filepath}", font=('Helvetica', 9, 'italic'), foreground=LIGHT_TEXT, background=FRAME_COLOR, wraplength=500).grid(row=row_counter, column=0, pady=5, sticky='w', padx=5); row_counter +=1
+            self._tpl_location_label.configure(text=f"Location: {filepath}")
+            self._tpl_location_label.grid()
             
+            desc_widgets = (self._tpl_desc_separator, self._tpl_desc_caption, self._tpl_desc_frame)
             if description:
-                ttk.Separator(content_frame, orient='horizontal').grid(row=row_counter, column=0, sticky='ew', pady=(10, 5), padx=5); row_counter +=1
-                ttk.Label(content_frame, text="Note:", style='Bold.TLabel', background=FRAME_COLOR).grid(row=row_counter, column=0, sticky='w', padx=5, pady=(5,0)); row_counter +=1
-                
-                desc_frame = ttk.Frame(content_frame, style='Content.TFrame')
-                desc_frame.grid(row=row_counter, column=0, sticky='ew', pady=5, padx=5); row_counter +=1
-                desc_frame.columnconfigure(0, weight=1)
-                
-                desc_text = scrolledtext.ScrolledText(
-                    desc_frame, wrap=tk.WORD, font=('Helvetica', 11),
-                    relief=tk.FLAT, bg=FRAME_COLOR, fg=TEXT_COLOR,
-                    bd=0, highlightthickness=0, height=10 # Default height
-                )
-                desc_text.insert("1.0", description)
-                desc_text.config(state=tk.DISABLED)
-                desc_text.grid(row=0, column=0, sticky='ew', padx=5, pady=5)
-
-            button_pack = ttk.Frame(content_frame, style='Content.TFrame')
-            button_pack.grid(row=row_counter, column=0, pady=20); row_counter +=1
-
-            open_button = ttk.Button(
-                button_pack,
-                text="Open File",
-                command=lambda p=filepath: self.open_file_externally(p),
-                style='TButton'
-            )
-            open_button.pack(side=tk.LEFT, padx=5)
+                self._set_readonly_text(self._tpl_desc_text, description)
+                for widget in desc_widgets:
+                    widget.grid()
+            else:
+                for widget in desc_widgets:
+                    widget.grid_remove()
             
-            open_dir_button = ttk.Button(
-                button_pack,
-                text="Open File Location",
-                command=lambda p=filepath: self.open_file_location(p),
-                style='TButton'
-            )
-            open_dir_button.pack(side=tk.LEFT, padx=5)
+            self._tpl_button_pack.grid()
 
-        # Delete button at the bottom (inside scrollable frame)
-        delete_button = ttk.Button(
-            self.scrollable_content_frame,
-            text="Delete This Entry",
-            command=lambda id=entry_id: self.delete_entry(id)
+        self._current_entry_id = entry_id
+        self._current_filepath = filepath
+        self._entry_frame.grid(row=0, column=0, sticky='nsew')
+
+    def request_preview_image(self, label, filepath):
+        """Shows a preview of the image file in label, fitted to the display width, decoding it on the image pool if needed."""
+        # Simple resize logic: fit to a max width (calc from canvas)
+        max_width = max(100, self._canvas_width - 20)
+        
+        try:
+            mtime = os.path.getmtime(filepath)
+        except OSError as e:
+            self.show_preview_error(label, e)
+            return
+        
+        # Keyed on mtime too, so an edited file is decoded again
+        key = (filepath, mtime, max_width)
+        photo = self._thumb_cache.get(key)
+        if photo is not None:
+            self._thumb_cache.move_to_end(key)
+            self.photo_image = photo
+            label.configure(image=photo, text='')
+            return
+        
+        self._pending_preview = self.run_in_background(
+            load_thumbnail, filepath, mtime, max_width,
+            on_done=lambda future: self.on_preview_loaded(future, key, label),
+            pool=self.image_pool
         )
-        delete_button.grid(row=3, column=0, pady=10, padx=5, sticky='se')
+
+    def on_preview_loaded(self, future, key, label):
+        """Tk-thread completion of a background image decode: installs the preview if it is still wanted."""
+        if future is not self._pending_preview:
+            return # Superseded by a newer selection (or cancelled)
+        self._pending_preview = None
+        
+        try:
+            img = future.result()
+            from PIL import ImageTk # May be packaged separately from Pillow (e.g. python3-pil.imagetk)
+            # PhotoImage must be created on the Tk thread
+            photo = ImageTk.PhotoImage(img)
+        except Exception as e:
+            self.show_preview_error(label, e)
+            return
+        
+        self._thumb_cache[key] = photo
+        if len(self._thumb_cache) > THUMB_CACHE_SIZE:
+            self._thumb_cache.popitem(last=False) # Drop the least recently shown
+        self.photo_image = photo
+        label.configure(image=photo, text='')
+
+    def show_preview_error(self, label, error):
+        """Replaces the preview placeholder with the error, and shows the file name instead of the image."""
+        label.configure(text=f"Error loading image: {error}", foreground='#ff8a80')
+        self._tpl_file_name_label.grid()
 
     def open_file_externally(self, filepath):
         """Opens the file using the system's default application."""
@@ -742,9 +1354,9 @@ class BrainDumpApp:
             if sys.platform == "win32":
                 os.startfile(os.path.normpath(filepath))
             elif sys.platform == "darwin": # macOS
-                subprocess.run(["open", filepath])
+                launch_detached(["open", filepath])
             else: # Linux and other UNIX-like
-                subprocess.run(["xdg-open", filepath])
+                launch_detached(["xdg-open", filepath])
         except Exception as e:
             messagebox.showerror("Error", f"Could not open file: {e}\n\nPath: {filepath}")
 
@@ -752,11 +1364,11 @@ class BrainDumpApp:
         """Opens the directory containing the file."""
         try:
             if sys.platform == "win32":
-                subprocess.run(["explorer", "/select,", os.path.normpath(filepath)])
+                launch_detached(["explorer", "/select,", os.path.normpath(filepath)])
             elif sys.platform == "darwin": # macOS
-                subprocess.run(["open", "-R", filepath])
+                launch_detached(["open", "-R", filepath])
             else: # Linux
-                subprocess.run(["xdg-open", os.path.dirname(filepath)])
+                launch_detached(["xdg-open", os.path.dirname(filepath)])
         except Exception as e:
             messagebox.showerror("Error", f"Could not open file location: {e}")
 
@@ -764,23 +1376,31 @@ class BrainDumpApp:
         """Deletes an entry from the database and its associated file (if any)."""
         if not messagebox.askyesno("Confirm Delete", "Are you sure you want to permanently delete this entry?"):
             return
-            
+        self.delete_entries([entry_id])
+
+    def delete_entries(self, entry_ids):
+        """Deletes several entries and their stored files, removing the rows in a single transaction."""
+        params = [(entry_id,) for entry_id in entry_ids]
+        placeholders = ', '.join('?' * len(entry_ids))
+        
         try:
-            self.cursor.execute("SELECT type, filepath FROM entries WHERE id = ?", (entry_id,))
-            entry = self.cursor.fetchone()
+            entries = self.conn.execute(f"SELECT type, filepath FROM entries WHERE id IN ({placeholders})", list(entry_ids)).fetchall()
             
-            if entry:
-                type, filepath = entry
-                if type == 'file' and filepath and os.path.exists(filepath):
+            for type, filepath in entries:
+                if type == 'file' and filepath:
                     try:
                         os.remove(filepath)
+                    except FileNotFoundError:
+                        pass # Already gone; just drop the entry
                     except OSError as e:
                         messagebox.showerror("File Error", f"Failed to delete file: {e}. The database entry will still be removed.")
             
-            self.cursor.execute("DELETE FROM entries WHERE id = ?", (entry_id,))
-            self.conn.commit()
+            with self.txn():
+                self.conn.executemany("DELETE FROM entry_tags WHERE entry_id = ?", params)
+                self.conn.executemany("DELETE FROM entries WHERE id = ?", params)
             
             # messagebox.showinfo("Deleted", "Entry has been deleted.") # Less intrusive
+            self._selected_entry_id = None
             self.load_entries()
             self.show_welcome_message()
             
@@ -793,6 +1413,10 @@ def main():
     app = BrainDumpApp(root)
     
     def on_closing():
+        app.image_pool.shutdown(wait=False, cancel_futures=True) # Previews are disposable
+        app.clear_display_frame()
+        app.io_pool.shutdown(wait=True) # Let in-flight file writes finish
+        app.run_completions() # ...and record them before the database is closed
         if app.conn:
             app.conn.close()
         root.destroy()